@@ -0,0 +1,49 @@
+"""
+Django settings used when running the test suite.
+"""
+from app.settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+# Silence log output such as django.request warnings for 4xx responses.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': True,
+}
+
+# PBKDF2 is deliberately slow; tests only need passwords to round-trip.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# The models use no Postgres-specific fields, so an in-memory SQLite database
+# is enough for the tests. Run with the project settings to test on Postgres.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Skip the browsable API renderer and multipart encoding; tests only
+# exchange small JSON payloads.
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,  # noqa: F405
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+    ],
+    'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+}
+
+
+class DisableMigrations:
+    """Build the test database schema directly from the models."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
@@ -2,30 +2,64 @@
 Test cases for the User API.
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
-from rest_framework.test import APIClient
-from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework import serializers, status
+
+from user.serializers import UserSerializer
+from user.views import ManageUserView
 
 # Define URLs for user creation and token generation
 CREATE_USER_URL = reverse('user:create')
 TOKEN_URL = reverse('user:token')
 ME_URL = reverse('user:me')
 
+# Resolve the user model once for the module
+User = get_user_model()
+
 # Helper function to create a user
 def create_user(**params):
     """Create and return a new user."""
-    user = get_user_model().objects.create_user(**params)
+    user = User.objects.create_user(**params)
     return user
 
+class PublicUserApiNoDbTests(SimpleTestCase):
+    """Test the public features of the User API that need no database."""
+
+    def test_password_too_short_error(self):
+        """Test an error is returned if password is too short."""
+        password_field = UserSerializer().fields['password']
+
+        # Check the short password fails the field's minimum length
+        with self.assertRaises(serializers.ValidationError):
+            password_field.run_validation('pw')
+
+    def test_retrieve_user_unauthorized(self):
+        """Test that authentication is required for users."""
+        # Call the user profile view directly without authentication
+        request = APIRequestFactory().get(ME_URL)
+        res = ManageUserView.as_view()(request)
+
+        # Check for unauthorized response
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 class PublicUserApiTests(TestCase):
     """Test the public features of the User API."""
+    client_class = APIClient
 
-    # Set up the test client
-    def setUp(self):
-        self.client = APIClient()
+    # Create the existing user once for the whole class
+    @classmethod
+    def setUpTestData(cls):
+        cls.existing_payload = {
+            'email': 'existing@example.com',
+            'password': 'testpass123',
+            'name': 'Existing User'
+        }
+        cls.existing_user = create_user(**cls.existing_payload)
 
     # Test for successful user creation
     def test_create_user_success(self):
@@ -43,7 +77,7 @@ class PublicUserApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
         # Verify the user was created correctly
-        user = get_user_model().objects.get(email=payload['email'])
+        user = User.objects.get(email=payload['email'])
 
         # Check password is correct
         self.assertTrue(user.check_password(payload['password']))
@@ -53,58 +87,19 @@ class PublicUserApiTests(TestCase):
 
     def test_user_with_email_exists_error(self):
         """Test error returned if user with email exists."""
-        payload = {
-            'email': 'test@example.com',
-            'password': 'testpass123',
-            'name': 'Test User'
-        }
-
-        # Create a user with the same email
-        create_user(**payload)
-
-        # Attempt to create another user with the same email
-        res = self.client.post(CREATE_USER_URL, payload)
-
-        # Check for bad request response
-        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_password_too_short_error(self):
-        """Test an error is returned if password is too short."""
-        payload = {
-            'email': 'test@example.com',
-            'password': 'pw',
-            'name': 'Test User'
-        }
-
-        # Attempt to create a user with a short password
-        res = self.client.post(CREATE_USER_URL, payload)
-
-        # Check for bad request response
-        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-
-        # Verify the user was not created
-        user_exists = get_user_model().objects.filter(
-            email=payload['email']
-        ).exists()
+        # Validate another user with the existing email
+        serializer = UserSerializer(data=self.existing_payload)
 
-        # Assert that the user does not exist
-        self.assertFalse(user_exists)
+        # Check the email is rejected
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('email', serializer.errors)
 
     def test_create_token_for_user(self):
         """Test generating a token for user."""
-        payload = {
-            'email': 'test@example.com',
-            'password': 'testpass123',
-            'name': 'Test User'
-        }
-
-        # Create a user
-        create_user(**payload)
-
-        # Generate token for the user
+        # Generate token for the existing user
         res = self.client.post(TOKEN_URL, {
-            'email': payload['email'],
-            'password': payload['password']
+            'email': self.existing_payload['email'],
+            'password': self.existing_payload['password']
         })
 
         # Check the response status code
@@ -113,68 +108,45 @@ class PublicUserApiTests(TestCase):
         # Verify the token is returned in the response
         self.assertIn('token', res.data)
 
-    def test_create_token_invalid_credentials(self):
-        """Test token is not created if invalid credentials are given."""
-        # Create a user with known credentials
-        create_user(
-            email='test@example.com',
-            password='testpass123',
-            name='Test User'
-        )
-
-        # Attempt to generate a token with invalid credentials
-        res = self.client.post(TOKEN_URL, {
-            'email': 'wrong@example.com',
-            'password': 'wrongpassword'
-        })
-
-        # Check the response status code
-        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-
-        # Verify the token is not returned in the response
-        self.assertNotIn('token', res.data)
-
-    def test_create_token_blank_password(self):
-        """Test posting a blank password returns an error."""
-        # Create a user with known credentials
-        create_user(
-            email='test@example.com',
-            password='testpass123',
-            name='Test User'
-        )
-
-        # Attempt to generate a token with a blank password
-        res = self.client.post(TOKEN_URL, {
-            'email': 'test@example.com',
-            'password': ''
-        })
-
-        # Check the response status code
-        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+    def test_create_token_rejected_cases(self):
+        """Test token is not created for invalid or blank credentials."""
+        rejected_credentials = [
+            # Invalid credentials
+            {'email': 'wrong@example.com', 'password': 'wrongpassword'},
+            # Blank password
+            {'email': self.existing_payload['email'], 'password': ''},
+        ]
 
-        # Verify the token is not returned in the response
-        self.assertNotIn('token', res.data)
+        for credentials in rejected_credentials:
+            with self.subTest(credentials=credentials):
+                # Attempt to generate a token with the credentials
+                res = self.client.post(TOKEN_URL, credentials)
 
-    def test_retrieve_user_unauthorized(self):
-        """Test that authentication is required for users."""
-        # Attempt to access the user profile endpoint without authentication
-        res = self.client.get(ME_URL)
+                # Check the response status code
+                self.assertEqual(
+                    res.status_code,
+                    status.HTTP_400_BAD_REQUEST
+                )
 
-        # Check for unauthorized response
-        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+                # Verify the token is not returned in the response
+                self.assertNotIn('token', res.data)
 
 
 class PrivateUserApiTests(TestCase):
     """Test API requests that require authentication."""
+    client_class = APIClient
 
-    # Set up the test client and authenticate a user
-    def setUp(self):
-        self.user = create_user(
+    # Create the authenticated user once for the whole class
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='test@example.com',
             password='testpass123',
             name='Test User'
         )
-        self.client = APIClient()
+
+    # Authenticate the user on the test client
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_profile_success(self):